@@ -1,5 +1,7 @@
 import os
 import math
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
 import pprint
 import psutil
 from matplotlib.patches import Patch
@@ -8,7 +10,7 @@ from matplotlib import cm
 import numpy as np
 import pandas as pd
 from scipy.stats import qmc
-from tqdm.contrib.concurrent import process_map
+from tqdm import tqdm
 from constants import Constants as const
 from constants import UnitConversion as uconv
 from data_handling import dataframe_to_csv, dict_to_json
@@ -93,14 +95,14 @@ def calc_a4_2f_lim(a2, B):
 
 
 def generate_hybrid_stars(number_of_samples=10**4):
-    """Function that generates a list of meshgrids representing the parameters of hybrid stars.
+    """Function that generates the parameter points of hybrid stars.
     This function also creates a dataframe with the parameters of hybrid stars
 
     Args:
         number_of_samples (int, optional): Number of samples used. Defaults to 10**4
 
     Returns:
-        Arrays of float: Masked meshgrids representing the parameters
+        Arrays of float: Arrays with the valid parameter points
         Pandas dataframe of float: Dataframe with the parameters of hybrid stars
     """
 
@@ -121,46 +123,53 @@ def generate_hybrid_stars(number_of_samples=10**4):
     B_max_mesh_mask = (B > B_max)
     B_min_mesh_mask = (B <= B_min) | (B <= calc_B_2f_lim(a2, a4)) | (B <= calc_B_3f_lim(a2, a4))
 
-    # Create the combined mask and apply to each mesh grid
+    # Create the combined mask
     mesh_mask = a2_max_mesh_mask | a2_min_mesh_mask | a4_max_mesh_mask | a4_min_mesh_mask | B_max_mesh_mask | B_min_mesh_mask
-    a2_masked = np.ma.masked_where(mesh_mask, a2)
-    a4_masked = np.ma.masked_where(mesh_mask, a4)
-    B_masked = np.ma.masked_where(mesh_mask, B)
 
-    # Loop over the mask and store the parameter points of the hybrid stars in a dataframe
-    iterator = np.nditer(mesh_mask, flags=["multi_index"])
-    parameter_points = []
-    for x in iterator:
-        if bool(x) is False:
-            index = iterator.multi_index
-            star_parameters = (a2[index]**(1 / 2), a4[index], B[index]**(1 / 4))
-            parameter_points.append(star_parameters)
-    parameter_dataframe = pd.DataFrame(parameter_points, columns=["a2^(1/2) [MeV]", "a4 [dimensionless]", "B^(1/4) [MeV]"])
+    # Select the valid parameter points of the hybrid stars and store them in a dataframe
+    valid_mask = ~mesh_mask
+    (a2, a4, B) = (a2[valid_mask], a4[valid_mask], B[valid_mask])
+    parameter_dataframe = pd.DataFrame({
+        "a2^(1/2) [MeV]": a2**(1 / 2),
+        "a4 [dimensionless]": a4,
+        "B^(1/4) [MeV]": B**(1 / 4),
+    })
 
-    return (a2_masked, a4_masked, B_masked, parameter_dataframe)
+    return (a2, a4, B, parameter_dataframe)
+
+
+@cache
+def create_hadron_eos():
+    """Function that creates the Hadron EOS object. The object is cached, as it is the same for every parameter point,
+    avoiding the reconstruction of the EOS interpolation tables at each star family analysis
+
+    Returns:
+        SLy4EOS object: Hadron EOS object
+    """
+    sly4_eos_rho_space = MAX_RHO * EOS_LOGSPACE
+    return SLy4EOS(sly4_eos_rho_space)
 
 
 def analyze_hybrid_star_family(dataframe_row):
     """Function that analyzes a star family, calculating the properties
 
     Args:
-        dataframe_row (list): Row of the dataframe with the index and hybrid EOS parameters
+        dataframe_row (list): Row of the dataframe with the hybrid EOS parameters
 
     Returns:
-        tuple: Tuple with index and star family properties calculated
+        tuple: Tuple with the star family properties calculated
     """
 
     # Unpack the row values
-    (index, a2_1_2, a4, B_1_4, *_) = dataframe_row
+    (a2_1_2, a4, B_1_4) = dataframe_row
     a2 = a2_1_2**2
     B = B_1_4**4
 
     # Create the QuarkEOS object
     quark_eos = QuarkEOS(a2, a4, B)
 
-    # Create the HadronEOS object
-    sly4_eos_rho_space = MAX_RHO * EOS_LOGSPACE
-    sly4_eos = SLy4EOS(sly4_eos_rho_space)
+    # Get the HadronEOS object
+    sly4_eos = create_hadron_eos()
 
     # Create the HybridEOS object
     sly4_maximum_stable_rho_center = 2.865e15 * uconv.MASS_DENSITY_CGS_TO_GU
@@ -228,19 +237,20 @@ def analyze_hybrid_star_family(dataframe_row):
         maximum_mass = star_family_object.maximum_mass
         maximum_cs = hybrid_eos.c_s(maximum_stable_rho_center)
 
+        # Find the maximum k2 star. Executed before the canonical star search, which reuses the solution of the same initial p_center space
+        star_family_object.find_maximum_k2_star()
+        maximum_k2_star_rho_center = star_family_object.maximum_k2_star_rho_center
+        maximum_k2 = star_family_object.maximum_k2
+
         # Find the canonical star
         star_family_object.find_canonical_star()
         canonical_rho_center = star_family_object.canonical_rho_center
         canonical_radius = star_family_object.canonical_radius
         canonical_lambda = star_family_object.canonical_lambda
 
-        # Find the maximum k2 star
-        star_family_object.find_maximum_k2_star()
-        maximum_k2_star_rho_center = star_family_object.maximum_k2_star_rho_center
-        maximum_k2 = star_family_object.maximum_k2
-
-    # Return the index and results
-    return (index, eos_type, rho_surface, minimum_cs, maximum_stable_rho_center, maximum_mass, maximum_cs, canonical_rho_center, canonical_radius, canonical_lambda, maximum_k2_star_rho_center, maximum_k2)
+    # Return the results, converted to Python floats to reduce the data sent back by the worker processes
+    results = (eos_type, rho_surface, minimum_cs, maximum_stable_rho_center, maximum_mass, maximum_cs, canonical_rho_center, canonical_radius, canonical_lambda, maximum_k2_star_rho_center, maximum_k2)
+    return tuple(float(result) for result in results)
 
 
 def analyze_hybrid_stars(parameter_dataframe):
@@ -259,10 +269,10 @@ def analyze_hybrid_stars(parameter_dataframe):
     # Calculate the number of rows, number of processes and number of calculations per process (chunksize)
     n_rows = parameter_dataframe.shape[0]
     processes = psutil.cpu_count(logical=False)             # Number of processes are equal to the number of hardware cores
-    chunksize = math.ceil(n_rows / (processes * 10))        # Create the chunksize smaller to provide some feedback on progress
+    chunksize = math.ceil(n_rows / (processes * 100))       # Use small chunks, balancing the load as the time per calculation varies widely with the parameters
 
-    # Create a list with the rows of the dataframe
-    rows_list = [list(row) for row in parameter_dataframe.itertuples()]
+    # Create a list with the rows of the dataframe, with the parameter values converted to Python floats (the results keep the rows order)
+    rows_list = parameter_dataframe.loc[:, ["a2^(1/2) [MeV]", "a4 [dimensionless]", "B^(1/4) [MeV]"]].to_numpy().tolist()
 
     # Check if DEBUG is activated
     if const.DEBUG is True:
@@ -270,21 +280,24 @@ def analyze_hybrid_stars(parameter_dataframe):
         results = [analyze_hybrid_star_family(row) for row in rows_list]
     else:
         # Execute the analysis for each row in parallel processes, using a progress bar from tqdm
-        results = process_map(analyze_hybrid_star_family, rows_list, max_workers=processes, chunksize=chunksize)
-
-    # Update the dataframe with the results
-    for index, eos_type, rho_surface, minimum_cs, maximum_stable_rho_center, maximum_mass, maximum_cs, canonical_rho_center, canonical_radius, canonical_lambda, maximum_k2_star_rho_center, maximum_k2 in results:
-        parameter_dataframe.at[index, "eos_type [0, 1, or 2]"] = eos_type
-        parameter_dataframe.at[index, "rho_surface [10^15 g cm^-3]"] = rho_surface * uconv.MASS_DENSITY_GU_TO_CGS / 10**15
-        parameter_dataframe.at[index, "cs_min [dimensionless]"] = minimum_cs
-        parameter_dataframe.at[index, "rho_center_max [10^15 g cm^-3]"] = maximum_stable_rho_center * uconv.MASS_DENSITY_GU_TO_CGS / 10**15
-        parameter_dataframe.at[index, "M_max [solar mass]"] = maximum_mass * uconv.MASS_GU_TO_SOLAR_MASS
-        parameter_dataframe.at[index, "cs_max [dimensionless]"] = maximum_cs
-        parameter_dataframe.at[index, "rho_center_canonical [10^15 g cm^-3]"] = canonical_rho_center * uconv.MASS_DENSITY_GU_TO_CGS / 10**15
-        parameter_dataframe.at[index, "R_canonical [km]"] = canonical_radius / 10**3
-        parameter_dataframe.at[index, "Lambda_canonical [dimensionless]"] = canonical_lambda
-        parameter_dataframe.at[index, "rho_center_k2_max [10^15 g cm^-3]"] = maximum_k2_star_rho_center * uconv.MASS_DENSITY_GU_TO_CGS / 10**15
-        parameter_dataframe.at[index, "k2_max [dimensionless]"] = maximum_k2
+        # Each worker creates the cached Hadron EOS object once at startup, instead of inside its first calculation
+        with ProcessPoolExecutor(max_workers=processes, initializer=create_hadron_eos) as executor:
+            results = list(tqdm(executor.map(analyze_hybrid_star_family, rows_list, chunksize=chunksize), total=n_rows))
+
+    # Update the dataframe with the results, converting the units of each whole column at once
+    (eos_type, rho_surface, minimum_cs, maximum_stable_rho_center, maximum_mass, maximum_cs, canonical_rho_center, canonical_radius, canonical_lambda, maximum_k2_star_rho_center, maximum_k2) = np.array(results).T
+    rho_scale = uconv.MASS_DENSITY_GU_TO_CGS / 10**15       # Conversion factor of the density from GU to [10^15 g cm^-3]
+    parameter_dataframe["eos_type [0, 1, or 2]"] = eos_type
+    parameter_dataframe["rho_surface [10^15 g cm^-3]"] = rho_surface * rho_scale
+    parameter_dataframe["cs_min [dimensionless]"] = minimum_cs
+    parameter_dataframe["rho_center_max [10^15 g cm^-3]"] = maximum_stable_rho_center * rho_scale
+    parameter_dataframe["M_max [solar mass]"] = maximum_mass * uconv.MASS_GU_TO_SOLAR_MASS
+    parameter_dataframe["cs_max [dimensionless]"] = maximum_cs
+    parameter_dataframe["rho_center_canonical [10^15 g cm^-3]"] = canonical_rho_center * rho_scale
+    parameter_dataframe["R_canonical [km]"] = canonical_radius / 10**3
+    parameter_dataframe["Lambda_canonical [dimensionless]"] = canonical_lambda
+    parameter_dataframe["rho_center_k2_max [10^15 g cm^-3]"] = maximum_k2_star_rho_center * rho_scale
+    parameter_dataframe["k2_max [dimensionless]"] = maximum_k2
 
     # Determine the EOS parameters limits based on observation data and create filtered dataframes
     eos_type_query = f"(`eos_type [0, 1, or 2]` > {eos_type_inf_limit}) & (`eos_type [0, 1, or 2]` < {eos_type_sup_limit})"
@@ -350,9 +363,9 @@ def plot_parameter_points_scatter(a2, a4, B, figure_path="figures/app_hybrid_eos
     """Function that plots the scatter graph of the parameter points
 
     Args:
-        a2 (3D array of float): Meshgrid with the a2 parameter of the EOS [MeV^2]
-        a4 (3D array of float): Meshgrid with the a4 parameter of the EOS [dimensionless]
-        B (3D array of float): Meshgrid with the B parameter of the EOS [MeV^4]
+        a2 (array of float): Array with the a2 parameter of the EOS [MeV^2]
+        a4 (array of float): Array with the a4 parameter of the EOS [dimensionless]
+        B (array of float): Array with the B parameter of the EOS [MeV^4]
         figure_path (str, optional): Path used to save the figure. Defaults to "figures/app_hybrid_eos"
     """
 
@@ -403,16 +416,16 @@ def plot_parameter_space(mesh_size=1000, figure_path="figures/app_hybrid_eos"):
     B_3f_lim_surface = calc_B_3f_lim(a2, a4)
     a4_2f_lim_surface = calc_a4_2f_lim(a2, B)
 
-    # Apply the mask to the meshgrids
+    # Apply the mask to the meshgrids, setting the masked points to NaN as they are not drawn by the plots
     mesh_mask_3f = (a2 > alpha * a4)
     B_2f_3f_line = calc_B_3f_lim(a2, a2 / alpha)
     mesh_mask_2f = ((B < B_min) | (B > B_2f_3f_line) | (a2 > (beta_1 + beta_2 * B)))
-    a2_3f_masked = np.ma.masked_where(mesh_mask_3f, a2)
-    a2_2f_masked = np.ma.masked_where(mesh_mask_2f, a2)
-    a4_3f_masked = np.ma.masked_where(mesh_mask_3f, a4)
-    a4_2f_lim_surface_masked = np.ma.masked_where(mesh_mask_2f, a4_2f_lim_surface)
-    B_3f_lim_surface_masked = np.ma.masked_where(mesh_mask_3f, B_3f_lim_surface)
-    B_2f_masked = np.ma.masked_where(mesh_mask_2f, B)
+    a2_3f_masked = np.where(mesh_mask_3f, np.nan, a2)
+    a2_2f_masked = np.where(mesh_mask_2f, np.nan, a2)
+    a4_3f_masked = np.where(mesh_mask_3f, np.nan, a4)
+    a4_2f_lim_surface_masked = np.where(mesh_mask_2f, np.nan, a4_2f_lim_surface)
+    B_3f_lim_surface_masked = np.where(mesh_mask_3f, np.nan, B_3f_lim_surface)
+    B_2f_masked = np.where(mesh_mask_2f, np.nan, B)
 
     # Create figure and change properties
     (fig, ax) = plt.subplots(subplot_kw={"projection": "3d"}, figsize=(5.0, 4.0), constrained_layout=True)
@@ -604,10 +617,10 @@ def main():
     plot_parameter_space(parameter_space_mesh_size, figures_path)
 
     # Generate parameters for hybrid stars
-    (a2_masked, a4_masked, B_masked, parameter_dataframe) = generate_hybrid_stars(number_of_samples)
+    (a2, a4, B, parameter_dataframe) = generate_hybrid_stars(number_of_samples)
 
     # Plot the parameter points generated for hybrid stars
-    plot_parameter_points_scatter(a2_masked, a4_masked, B_masked, figures_path)
+    plot_parameter_points_scatter(a2, a4, B, figures_path)
 
     # Analize the hybrid stars generated
     (parameter_dataframe, filtered_dataframe, parameters_limits, properties_limits) = analyze_hybrid_stars(parameter_dataframe)
@@ -19,12 +19,17 @@ from star_family_tides import DeformedStarFamily
 # Constants
 g0 = 930.0                                                              # Gibbs free energy per baryon of quark matter at null pressure [MeV]
 alpha = ((1 / 3) - 8 / (3 * (1 + 2**(1 / 3))**3)) * g0**2               # alpha coefficient of the a2_max vs a4 curve [MeV^2]
+B_max_a4_coef = g0**4 / (108 * np.pi**2)                                # a4 coefficient of the B_max plane [MeV^4]
+B_max_a2_coef = - 9 * g0**2 / (108 * np.pi**2)                          # a2 coefficient of the B_max plane [MeV^2]
+B_min_a4_coef = 4 * g0**4 / (54 * np.pi**2 * (1 + 2**(1 / 3))**3)       # a4 coefficient of the B_min plane [MeV^4]
+B_min_a2_coef = - 3 * g0**2 / (54 * np.pi**2)                           # a2 coefficient of the B_min plane [MeV^2]
 a2_min = -alpha                                                         # Minimum a2 parameter value [MeV^2]
 a2_max = alpha                                                          # Maximum a2 parameter value [MeV^2]
 a4_min = 0.05                                                           # Minimum a4 parameter value [dimensionless]
 a4_max = 1.0                                                            # Maximum a4 parameter value [dimensionless]
 B_min = 0.0                                                             # Minimum B parameter value [MeV^4]
 B_max = (g0**2 / (108 * np.pi**2)) * (g0**2 * a4_max - 9 * a2_min)      # Maximum B parameter value [MeV^4]
+STARS_LOGSPACE = np.logspace(-3.0, 0.0, 20)                             # Logspace used to create the star family
 
 # Observation data
 M_max_inf_limit = 2.13                  # Inferior limit of the maximum mass [solar mass] (Romani - 2 sigma)
@@ -56,7 +61,7 @@ def calc_B_max(a2, a4):
     Returns:
         array of float: Maximum B value [MeV^4]
     """
-    return (g0**2 / (108 * np.pi**2)) * (g0**2 * a4 - 9 * a2)
+    return B_max_a4_coef * a4 + B_max_a2_coef * a2
 
 
 def calc_B_min(a2, a4):
@@ -69,18 +74,18 @@ def calc_B_min(a2, a4):
     Returns:
         array of float: Minimum B value [MeV^4]
     """
-    return (g0**2 / (54 * np.pi**2)) * ((4 * g0**2 * a4) / ((1 + 2**(1 / 3))**3) - 3 * a2)
+    return B_min_a4_coef * a4 + B_min_a2_coef * a2
 
 
 def generate_strange_stars(number_of_samples=10**4):
-    """Function that generates a list of meshgrids representing the parameters of strange stars.
+    """Function that generates the parameter points of strange stars.
     This function also creates a dataframe with the parameters of strange stars
 
     Args:
         number_of_samples (int, optional): Number of samples used. Defaults to 10**4
 
     Returns:
-        Arrays of float: Masked meshgrids representing the parameters
+        Arrays of float: Arrays with the valid parameter points
         Pandas dataframe of float: Dataframe with the parameters of strange stars
     """
 
@@ -93,45 +98,38 @@ def generate_strange_stars(number_of_samples=10**4):
     scaled_samples = qmc.scale(samples, l_bounds, u_bounds)     # Scale the samples
     (a2, a4, B) = (scaled_samples[:, 0], scaled_samples[:, 1], scaled_samples[:, 2]**4)
 
-    # Create the mesh masks according to each parameter minimum and maximum allowed values
-    a2_max_mesh_mask = (a2 >= alpha * a4)
-    a2_min_mesh_mask = (a2 <= a2_min)
-    a4_max_mesh_mask = (a4 > a4_max)
-    a4_min_mesh_mask = (a4 <= a4_min)
-    B_max_mesh_mask = (B >= calc_B_max(a2, a4))
-    B_min_mesh_mask = (B <= calc_B_min(a2, a4))
-
-    # Create the combined mask and apply to each mesh grid
-    mesh_mask = a2_max_mesh_mask | a2_min_mesh_mask | a4_max_mesh_mask | a4_min_mesh_mask | B_max_mesh_mask | B_min_mesh_mask
-    a2_masked = np.ma.masked_where(mesh_mask, a2)
-    a4_masked = np.ma.masked_where(mesh_mask, a4)
-    B_masked = np.ma.masked_where(mesh_mask, B)
-
-    # Loop over the mask and store the parameter points of the strange stars in a dataframe
-    iterator = np.nditer(mesh_mask, flags=["multi_index"])
-    parameter_points = []
-    for x in iterator:
-        if bool(x) is False:
-            index = iterator.multi_index
-            star_parameters = (a2[index], a4[index], B[index]**(1 / 4))
-            parameter_points.append(star_parameters)
-    parameter_dataframe = pd.DataFrame(parameter_points, columns=["a2 [MeV^2]", "a4 [dimensionless]", "B^(1/4) [MeV]"])
-
-    return (a2_masked, a4_masked, B_masked, parameter_dataframe)
+    # Create the combined mesh mask according to each parameter minimum and maximum allowed values, accumulating the conditions in place
+    mesh_mask = (a2 >= alpha * a4)
+    mesh_mask |= (a2 <= a2_min)
+    mesh_mask |= (a4 > a4_max)
+    mesh_mask |= (a4 <= a4_min)
+    mesh_mask |= (B >= calc_B_max(a2, a4))
+    mesh_mask |= (B <= calc_B_min(a2, a4))
+
+    # Select the valid parameter points of the strange stars and store them in a dataframe
+    valid_mask = ~mesh_mask
+    (a2, a4, B) = (a2[valid_mask], a4[valid_mask], B[valid_mask])
+    parameter_dataframe = pd.DataFrame({
+        "a2 [MeV^2]": a2,
+        "a4 [dimensionless]": a4,
+        "B^(1/4) [MeV]": B**(1 / 4),
+    })
+
+    return (a2, a4, B, parameter_dataframe)
 
 
 def analyze_strange_star_family(dataframe_row):
     """Function that analyzes a star family, calculating the properties
 
     Args:
-        dataframe_row (list): Row of the dataframe with the index and quark EOS parameters
+        dataframe_row (list): Row of the dataframe with the quark EOS parameters
 
     Returns:
-        tuple: Tuple with index and star family properties calculated
+        tuple: Tuple with the star family properties calculated
     """
 
     # Unpack the row values
-    (index, a2, a4, B_1_4, *_) = dataframe_row
+    (a2, a4, B_1_4) = dataframe_row
     B = B_1_4**4
 
     # Create the EOS object
@@ -150,7 +148,7 @@ def analyze_strange_star_family(dataframe_row):
     p_center = quark_eos.p(rho_center)                      # Central pressure [m^-2]
 
     # Set the p_center space that characterizes the star family
-    p_center_space = p_center * np.logspace(-3.0, 0.0, 20)
+    p_center_space = p_center * STARS_LOGSPACE
 
     # Create the star family object
     star_family_object = DeformedStarFamily(
@@ -166,19 +164,20 @@ def analyze_strange_star_family(dataframe_row):
     maximum_mass = star_family_object.maximum_mass
     maximum_cs = quark_eos.c_s(maximum_stable_rho_center)
 
+    # Find the maximum k2 star. Executed before the canonical star search, which reuses the solution of the same initial p_center space
+    star_family_object.find_maximum_k2_star()
+    maximum_k2_star_rho_center = star_family_object.maximum_k2_star_rho_center
+    maximum_k2 = star_family_object.maximum_k2
+
     # Find the canonical star
     star_family_object.find_canonical_star()
     canonical_rho_center = star_family_object.canonical_rho_center
     canonical_radius = star_family_object.canonical_radius
     canonical_lambda = star_family_object.canonical_lambda
 
-    # Find the maximum k2 star
-    star_family_object.find_maximum_k2_star()
-    maximum_k2_star_rho_center = star_family_object.maximum_k2_star_rho_center
-    maximum_k2 = star_family_object.maximum_k2
-
-    # Return the index and results
-    return (index, rho_surface, minimum_cs, maximum_stable_rho_center, maximum_mass, maximum_cs, canonical_rho_center, canonical_radius, canonical_lambda, maximum_k2_star_rho_center, maximum_k2)
+    # Return the results, converted to Python floats to reduce the data sent back by the worker processes
+    results = (rho_surface, minimum_cs, maximum_stable_rho_center, maximum_mass, maximum_cs, canonical_rho_center, canonical_radius, canonical_lambda, maximum_k2_star_rho_center, maximum_k2)
+    return tuple(float(result) for result in results)
 
 
 def analyze_strange_stars(parameter_dataframe):
@@ -197,10 +196,10 @@ def analyze_strange_stars(parameter_dataframe):
     # Calculate the number of rows, number of processes and number of calculations per process (chunksize)
     n_rows = parameter_dataframe.shape[0]
     processes = psutil.cpu_count(logical=False)             # Number of processes are equal to the number of hardware cores
-    chunksize = math.ceil(n_rows / (processes * 10))        # Create the chunksize smaller to provide some feedback on progress
+    chunksize = math.ceil(n_rows / (processes * 100))       # Use small chunks, balancing the load as the time per calculation varies widely with the parameters
 
-    # Create a list with the rows of the dataframe
-    rows_list = [list(row) for row in parameter_dataframe.itertuples()]
+    # Create a list with the rows of the dataframe, with the parameter values converted to Python floats (the results keep the rows order)
+    rows_list = parameter_dataframe.loc[:, ["a2 [MeV^2]", "a4 [dimensionless]", "B^(1/4) [MeV]"]].to_numpy().tolist()
 
     # Check if DEBUG is activated
     if const.DEBUG is True:
@@ -210,18 +209,19 @@ def analyze_strange_stars(parameter_dataframe):
         # Execute the analysis for each row in parallel processes, using a progress bar from tqdm
         results = process_map(analyze_strange_star_family, rows_list, max_workers=processes, chunksize=chunksize)
 
-    # Update the dataframe with the results
-    for index, rho_surface, minimum_cs, maximum_stable_rho_center, maximum_mass, maximum_cs, canonical_rho_center, canonical_radius, canonical_lambda, maximum_k2_star_rho_center, maximum_k2 in results:
-        parameter_dataframe.at[index, "rho_surface [10^15 g cm^-3]"] = rho_surface * uconv.MASS_DENSITY_GU_TO_CGS / 10**15
-        parameter_dataframe.at[index, "cs_min [dimensionless]"] = minimum_cs
-        parameter_dataframe.at[index, "rho_center_max [10^15 g cm^-3]"] = maximum_stable_rho_center * uconv.MASS_DENSITY_GU_TO_CGS / 10**15
-        parameter_dataframe.at[index, "M_max [solar mass]"] = maximum_mass * uconv.MASS_GU_TO_SOLAR_MASS
-        parameter_dataframe.at[index, "cs_max [dimensionless]"] = maximum_cs
-        parameter_dataframe.at[index, "rho_center_canonical [10^15 g cm^-3]"] = canonical_rho_center * uconv.MASS_DENSITY_GU_TO_CGS / 10**15
-        parameter_dataframe.at[index, "R_canonical [km]"] = canonical_radius / 10**3
-        parameter_dataframe.at[index, "Lambda_canonical [dimensionless]"] = canonical_lambda
-        parameter_dataframe.at[index, "rho_center_k2_max [10^15 g cm^-3]"] = maximum_k2_star_rho_center * uconv.MASS_DENSITY_GU_TO_CGS / 10**15
-        parameter_dataframe.at[index, "k2_max [dimensionless]"] = maximum_k2
+    # Update the dataframe with the results, converting the units of each whole column at once
+    (rho_surface, minimum_cs, maximum_stable_rho_center, maximum_mass, maximum_cs, canonical_rho_center, canonical_radius, canonical_lambda, maximum_k2_star_rho_center, maximum_k2) = np.array(results).T
+    rho_scale = uconv.MASS_DENSITY_GU_TO_CGS / 10**15       # Conversion factor of the density from GU to [10^15 g cm^-3]
+    parameter_dataframe["rho_surface [10^15 g cm^-3]"] = rho_surface * rho_scale
+    parameter_dataframe["cs_min [dimensionless]"] = minimum_cs
+    parameter_dataframe["rho_center_max [10^15 g cm^-3]"] = maximum_stable_rho_center * rho_scale
+    parameter_dataframe["M_max [solar mass]"] = maximum_mass * uconv.MASS_GU_TO_SOLAR_MASS
+    parameter_dataframe["cs_max [dimensionless]"] = maximum_cs
+    parameter_dataframe["rho_center_canonical [10^15 g cm^-3]"] = canonical_rho_center * rho_scale
+    parameter_dataframe["R_canonical [km]"] = canonical_radius / 10**3
+    parameter_dataframe["Lambda_canonical [dimensionless]"] = canonical_lambda
+    parameter_dataframe["rho_center_k2_max [10^15 g cm^-3]"] = maximum_k2_star_rho_center * rho_scale
+    parameter_dataframe["k2_max [dimensionless]"] = maximum_k2
 
     # Determine the EOS parameters limits based on observation data and create filtered dataframes
     M_max_query = f"(`M_max [solar mass]` > {M_max_inf_limit}) & (`M_max [solar mass]` < {M_max_sup_limit})"
@@ -282,9 +282,9 @@ def plot_parameter_points_scatter(a2, a4, B, figure_path="figures/app_quark_eos"
     """Function that plots the scatter graph of the parameter points
 
     Args:
-        a2 (3D array of float): Meshgrid with the a2 parameter of the EOS [MeV^2]
-        a4 (3D array of float): Meshgrid with the a4 parameter of the EOS [dimensionless]
-        B (3D array of float): Meshgrid with the B parameter of the EOS [MeV^4]
+        a2 (array of float): Array with the a2 parameter of the EOS [MeV^2]
+        a4 (array of float): Array with the a4 parameter of the EOS [dimensionless]
+        B (array of float): Array with the B parameter of the EOS [MeV^4]
         figure_path (str, optional): Path used to save the figure. Defaults to "figures/app_quark_eos"
     """
 
@@ -321,21 +321,23 @@ def plot_parameter_space(mesh_size=1000, figure_path="figures/app_quark_eos"):
         figure_path (str, optional): Path used to save the figure. Defaults to "figures/app_quark_eos"
     """
 
-    # Define the (a2, a4) rectangular meshgrid
-    a2_range = np.linspace(a2_min, a2_max, mesh_size)
-    a4_range = np.linspace(a4_min, a4_max, mesh_size)
-    (a2, a4) = np.meshgrid(a2_range, a4_range)
+    # Define the (a2, a4) rectangular grid as broadcastable 1-D vectors, with the same layout as the default meshgrid indexing
+    a2 = np.linspace(a2_min, a2_max, mesh_size)[np.newaxis, :]
+    a4 = np.linspace(a4_min, a4_max, mesh_size)[:, np.newaxis]
 
-    # Create the B_max and B_min surfaces
+    # Create the B_max and B_min surfaces, letting numpy broadcast the grid vectors
     B_max_surface = calc_B_max(a2, a4)
     B_min_surface = calc_B_min(a2, a4)
 
-    # Apply the triangular mask to the meshgrid
+    # Create the triangular mask, and expand the grid vectors to 2-D views (without copying) as required by the plots
     mesh_mask = (a2 > alpha * a4)
-    a2_masked = np.ma.masked_where(mesh_mask, a2)
-    a4_masked = np.ma.masked_where(mesh_mask, a4)
-    B_max_surface_masked = np.ma.masked_where(mesh_mask, B_max_surface)
-    B_min_surface_masked = np.ma.masked_where(mesh_mask, B_min_surface)
+    (a2, a4) = np.broadcast_arrays(a2, a4)
+
+    # Apply the triangular mask to the meshgrid, setting the masked points to NaN as they are not drawn by the plots
+    a2_masked = np.where(mesh_mask, np.nan, a2)
+    a4_masked = np.where(mesh_mask, np.nan, a4)
+    B_max_surface_masked = np.where(mesh_mask, np.nan, B_max_surface)
+    B_min_surface_masked = np.where(mesh_mask, np.nan, B_min_surface)
 
     # Create figure and change properties
     (fig, ax) = plt.subplots(subplot_kw={"projection": "3d"}, figsize=(5.0, 4.0), constrained_layout=True)
@@ -570,10 +572,10 @@ def main():
     plot_parameter_space(parameter_space_mesh_size, figures_path)
 
     # Generate parameters for strange stars
-    (a2_masked, a4_masked, B_masked, parameter_dataframe) = generate_strange_stars(number_of_samples)
+    (a2, a4, B, parameter_dataframe) = generate_strange_stars(number_of_samples)
 
     # Plot the parameter points generated for strange stars
-    plot_parameter_points_scatter(a2_masked, a4_masked, B_masked, figures_path)
+    plot_parameter_points_scatter(a2, a4, B, figures_path)
 
     # Analize the strange stars generated
     (parameter_dataframe, filtered_dataframe, parameters_limits, properties_limits) = analyze_strange_stars(parameter_dataframe)
@@ -1,4 +1,3 @@
-from astropy import constants as const
 import numpy as np
 
 
@@ -38,12 +37,12 @@ class UnitConversion:
     Ensure consistency when applying these conversions.
     """
 
-    # Universal constants in SI
-    MeV = 10**6 * const.e.si.value      # [J]
-    hbar = const.hbar.si.value          # [J s]
-    c = const.c.si.value                # [m s^-1]
-    G = const.G.si.value                # [m^3 kg^-1 s^-2]
-    M_sun = const.M_sun.si.value        # [kg]
+    # Universal constants in SI (CODATA 2022 and IAU 2015 values, the same given by astropy.constants)
+    MeV = 10**6 * 1.602176634e-19       # [J]
+    hbar = 1.0545718176461565e-34       # [J s]
+    c = 299792458.0                     # [m s^-1]
+    G = 6.6743e-11                      # [m^3 kg^-1 s^-2]
+    M_sun = 1.988409870698051e30        # [kg]
 
     # Conversion between SI and CGS
     PRESSURE_SI_TO_CGS = 10
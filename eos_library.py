@@ -1,4 +1,7 @@
 import os
+import math
+from bisect import bisect_right
+from functools import lru_cache
 import matplotlib.pyplot as plt
 import numpy as np
 from scipy.interpolate import CubicSpline
@@ -46,6 +49,70 @@ class EOS:
             if debug_msg is True:
                 print(f"{self.eos_name} maximum stable rho = {(self.maximum_stable_rho * uconv.MASS_DENSITY_GU_TO_CGS):e} [g cm^-3]")
 
+    @staticmethod
+    def _create_spline_table(spline_function):
+        """Method that creates the table used to evaluate a spline function at scalar points
+
+        Args:
+            spline_function (PPoly object): Spline function, given by a CubicSpline object or its derivatives
+
+        Returns:
+            tuple: Tuple with the list of breakpoints and the list with the polynomial coefficients of each interval, in increasing degree order
+        """
+        return (spline_function.x.tolist(), spline_function.c[::-1].T.tolist())
+
+    @staticmethod
+    def _eval_spline_table(x, spline_table):
+        """Method that evaluates a spline function at a scalar point, using the table created by _create_spline_table.
+        It gives the same result of the spline function call without extrapolation, avoiding its numpy overhead
+
+        Args:
+            x (float): Point where the spline function is evaluated
+            spline_table (tuple): Table of the spline function
+
+        Returns:
+            float: Value of the spline function, or NaN outside the breakpoints interval
+        """
+
+        # Return NaN outside the breakpoints interval, as the spline function without extrapolation
+        (breakpoints, coefficients) = spline_table
+        if not (breakpoints[0] <= x <= breakpoints[-1]):
+            return math.nan
+
+        # Find the interval using bisection, including the last breakpoint in the last interval
+        interval = min(bisect_right(breakpoints, x), len(breakpoints) - 1) - 1
+
+        # Sum the polynomial terms of the interval
+        dx = x - breakpoints[interval]
+        value = 0.0
+        dx_power = 1.0
+        for coefficient in coefficients[interval]:
+            value += coefficient * dx_power
+            dx_power *= dx
+
+        return value
+
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _load_table(file_name, usecols, unit_conversion):
+        """Method that loads the columns of an EOS table file, caching the result as the same tables are loaded by many EOS objects
+
+        Args:
+            file_name (str): File name of the table with the EOS
+            usecols (tuple of int): Column numbers of the table to be loaded
+            unit_conversion (tuple of float): Conversion multiplicative factor for each column
+
+        Returns:
+            tuple of arrays: Read-only numpy arrays with the loaded columns
+        """
+
+        # Load the columns and set them as read-only, as the cached arrays are shared by all the EOS objects
+        columns = csv_to_arrays(file_name=file_name, usecols=usecols, unit_conversion=unit_conversion)
+        for column in columns:
+            column.flags.writeable = False
+
+        return columns
+
     def _config_plot(self):
         """Method that configures the plotting
         """
@@ -286,14 +353,19 @@ class PolytropicEOS(EOS):
         self.k = float(k)
         self.m = 1.0 + 1.0 / float(n)
 
+        # Precompute the exponent and coefficient of rho(p) and drho_dp(p), as they are evaluated at every ODE solver step.
+        # These methods use the builtin abs, which avoids the numpy overhead for scalars and also works with arrays
+        self.rho_exponent = 1 / self.m
+        self.drho_dp_coefficient = 1 / (self.k * self.m)
+
     def rho(self, p):
-        return np.abs(p / self.k)**(1 / self.m)
+        return abs(p / self.k)**self.rho_exponent
 
     def p(self, rho):
         return self.k * rho**self.m
 
     def drho_dp(self, p):
-        return (1 / (self.k * self.m)) * np.abs(p / self.k)**((1 / self.m) - 1)
+        return self.drho_dp_coefficient * abs(p / self.k)**(self.rho_exponent - 1)
 
     def dp_drho(self, rho):
         return self.k * self.m * rho**(self.m - 1)
@@ -318,8 +390,9 @@ class TableEOS(EOS):
         self.eos_name = eos_name
 
         # Open the .csv file with the EOS
-        (rho, p) = csv_to_arrays(
+        (rho, p) = self._load_table(
             file_name=file_name,
+            usecols=(0, 1),
             unit_conversion=(uconv.MASS_DENSITY_CGS_TO_GU, uconv.PRESSURE_CGS_TO_GU))
 
         # Convert the EOS to spline functions
@@ -330,6 +403,12 @@ class TableEOS(EOS):
         self.drho_dp_spline_function = self.rho_spline_function.derivative()
         self.dp_drho_spline_function = self.p_spline_function.derivative()
 
+        # Create the spline tables, used in the evaluation at scalar points (as done by the ODE solvers)
+        self.rho_spline_table = self._create_spline_table(self.rho_spline_function)
+        self.p_spline_table = self._create_spline_table(self.p_spline_function)
+        self.drho_dp_spline_table = self._create_spline_table(self.drho_dp_spline_function)
+        self.dp_drho_spline_table = self._create_spline_table(self.dp_drho_spline_function)
+
         # Save the maximum and minimum density and pressure
         self.rho_max = rho[-1]
         self.p_max = p[-1]
@@ -337,15 +416,23 @@ class TableEOS(EOS):
         self.p_min = p[0]
 
     def rho(self, p):
+        if isinstance(p, float) or np.ndim(p) == 0:
+            return self._eval_spline_table(p, self.rho_spline_table)
         return self.rho_spline_function(p)
 
     def p(self, rho):
+        if isinstance(rho, float) or np.ndim(rho) == 0:
+            return self._eval_spline_table(rho, self.p_spline_table)
         return self.p_spline_function(rho)
 
     def drho_dp(self, p):
+        if isinstance(p, float) or np.ndim(p) == 0:
+            return self._eval_spline_table(p, self.drho_dp_spline_table)
         return self.drho_dp_spline_function(p)
 
     def dp_drho(self, rho):
+        if isinstance(rho, float) or np.ndim(rho) == 0:
+            return self._eval_spline_table(rho, self.dp_drho_spline_table)
         return self.dp_drho_spline_function(rho)
 
 
@@ -374,6 +461,12 @@ class InterpolatedEOS(EOS):
         self.drho_dp_spline_function = self.rho_spline_function.derivative()
         self.dp_drho_spline_function = self.p_spline_function.derivative()
 
+        # Create the spline tables, used in the evaluation at scalar points (as done by the ODE solvers)
+        self.rho_spline_table = self._create_spline_table(self.rho_spline_function)
+        self.p_spline_table = self._create_spline_table(self.p_spline_function)
+        self.drho_dp_spline_table = self._create_spline_table(self.drho_dp_spline_function)
+        self.dp_drho_spline_table = self._create_spline_table(self.dp_drho_spline_function)
+
         # Save the maximum and minimum density and pressure
         self.rho_max = rho_space[-1]
         self.p_max = p_space[-1]
@@ -392,15 +485,23 @@ class InterpolatedEOS(EOS):
         return rho
 
     def rho(self, p):
+        if isinstance(p, float) or np.ndim(p) == 0:
+            return self._eval_spline_table(p, self.rho_spline_table)
         return self.rho_spline_function(p)
 
     def p(self, rho):
+        if isinstance(rho, float) or np.ndim(rho) == 0:
+            return self._eval_spline_table(rho, self.p_spline_table)
         return self.p_spline_function(rho)
 
     def drho_dp(self, p):
+        if isinstance(p, float) or np.ndim(p) == 0:
+            return self._eval_spline_table(p, self.drho_dp_spline_table)
         return self.drho_dp_spline_function(p)
 
     def dp_drho(self, rho):
+        if isinstance(rho, float) or np.ndim(rho) == 0:
+            return self._eval_spline_table(rho, self.dp_drho_spline_table)
         return self.dp_drho_spline_function(rho)
 
 
@@ -428,6 +529,21 @@ class QuarkEOS(EOS):
         self.a4 = a4
         self.B = B
 
+        # Precompute the coefficients of rho(p) and drho_dp(p) for the given parameters, as they are evaluated at every ODE solver step
+        self.rho_sqrt_coefficient = (16 * np.pi**2 * a4) / (3 * a2**2)      # Coefficient of (p + B) inside the square root [MeV^-4]
+        self.rho_term_coefficient = (3 * a2**2) / (4 * np.pi**2 * a4)       # Coefficient of the square root term [MeV^4]
+        self.four_B = 4 * B                                                 # Constant term [MeV^4]
+
+        # Precompute the coefficients of p(rho) and dp_drho(rho)
+        self.p_sqrt_coefficient = (16 * np.pi**2 * a4) / a2**2              # Coefficient of (rho - B) inside the square root [MeV^-4]
+        self.p_term_coefficient = a2**2 / (12 * np.pi**2 * a4)              # Coefficient of the square root term [MeV^4]
+
+        # Precompute the coefficients of p(mu) and mu(p)
+        alpha = 3 / (4 * np.pi**2)
+        self.p_of_mu_a4_coefficient = alpha * a4                            # Coefficient of mu**4 [dimensionless]
+        self.p_of_mu_a2_coefficient = alpha * a2                            # Coefficient of mu**2 [MeV^2]
+        self.mu_of_p_coefficient = (a2 / (2 * a4))**(1 / 2)                 # Coefficient of the mu(p) expression [MeV]
+
     def p_of_mu(self, mu):
         """Function of the pressure in terms of the chemical potential
 
@@ -438,12 +554,7 @@ class QuarkEOS(EOS):
             float: Pressure [MeV^4]
         """
 
-        a2 = self.a2
-        a4 = self.a4
-        B = self.B
-
-        alpha = 3 / (4 * np.pi**2)
-        p = alpha * a4 * mu**4 - alpha * a2 * mu**2 - B
+        p = self.p_of_mu_a4_coefficient * mu**4 - self.p_of_mu_a2_coefficient * mu**2 - self.B
 
         return p
 
@@ -457,11 +568,7 @@ class QuarkEOS(EOS):
             float: Chemical potential [MeV]
         """
 
-        a2 = self.a2
-        a4 = self.a4
-        B = self.B
-
-        mu = (a2 / (2 * a4))**(1 / 2) * (1 + (1 + ((16 * np.pi**2 * a4) / (3 * a2**2)) * (p + B))**(1 / 2))**(1 / 2)
+        mu = self.mu_of_p_coefficient * (1 + (1 + self.rho_sqrt_coefficient * (p + self.B))**(1 / 2))**(1 / 2)
 
         return mu
 
@@ -469,13 +576,9 @@ class QuarkEOS(EOS):
 
         p_nu = p * uconv.PRESSURE_GU_TO_NU                  # Convert to NU
 
-        a2 = self.a2
-        a4 = self.a4
-        B = self.B
-
         rho_nu = (
-            3 * p_nu + 4 * B + ((3 * a2**2) / (4 * np.pi**2 * a4)) * (
-                1 + (1 + ((16 * np.pi**2 * a4) / (3 * a2**2)) * (p_nu + B))**(1 / 2)
+            3 * p_nu + self.four_B + self.rho_term_coefficient * (
+                1 + (1 + self.rho_sqrt_coefficient * (p_nu + self.B))**(1 / 2)
             )
         )
 
@@ -485,13 +588,9 @@ class QuarkEOS(EOS):
 
         rho_nu = rho * uconv.ENERGY_DENSITY_GU_TO_NU        # Convert to NU
 
-        a2 = self.a2
-        a4 = self.a4
-        B = self.B
-
         p_nu = (
-            (1 / 3) * (rho_nu - 4 * B) - (a2**2 / (12 * np.pi**2 * a4)) * (
-                1 + (1 + ((16 * np.pi**2 * a4) / a2**2) * (rho_nu - B))**(1 / 2)
+            (1 / 3) * (rho_nu - self.four_B) - self.p_term_coefficient * (
+                1 + (1 + self.p_sqrt_coefficient * (rho_nu - self.B))**(1 / 2)
             )
         )
 
@@ -501,12 +600,8 @@ class QuarkEOS(EOS):
 
         p_nu = p * uconv.PRESSURE_GU_TO_NU                  # Convert to NU
 
-        a2 = self.a2
-        a4 = self.a4
-        B = self.B
-
         drho_dp = (
-            3 + 2 * (1 + ((16 * np.pi**2 * a4) / (3 * a2**2)) * (p_nu + B))**(-1 / 2)
+            3 + 2 * (1 + self.rho_sqrt_coefficient * (p_nu + self.B))**(-1 / 2)
         )
 
         return drho_dp      # Return result (dimensionless, so NU and GU are the same)
@@ -515,12 +610,8 @@ class QuarkEOS(EOS):
 
         rho_nu = rho * uconv.ENERGY_DENSITY_GU_TO_NU        # Convert to NU
 
-        a2 = self.a2
-        a4 = self.a4
-        B = self.B
-
         dp_drho = (
-            (1 / 3) - (2 / 3) * (1 + ((16 * np.pi**2 * a4) / a2**2) * (rho_nu - B))**(-1 / 2)
+            (1 / 3) - (2 / 3) * (1 + self.p_sqrt_coefficient * (rho_nu - self.B))**(-1 / 2)
         )
 
         return dp_drho      # Return result (dimensionless, so NU and GU are the same)
@@ -586,7 +677,7 @@ class HybridEOS(EOS):
         # Open the HadronEOS table file, using Natural Units (NU)
         nb_fm_3_to_si = (10**-15)**(-3)     # Conversion factor from fm^-3 to m^-3 (SI)
         nb_fm_3_to_nu = nb_fm_3_to_si * uconv.NUMBER_DENSITY_SI_TO_NU
-        (rho_hadron_nu, self.p_hadron_nu, nb_hadron_nu) = csv_to_arrays(
+        (rho_hadron_nu, self.p_hadron_nu, nb_hadron_nu) = self._load_table(
             file_name=self.hadron_eos_table_file_name,
             usecols=(0, 1, 2),
             unit_conversion=(uconv.MASS_DENSITY_CGS_TO_GU * uconv.ENERGY_DENSITY_GU_TO_NU,
@@ -658,7 +749,7 @@ class HybridEOS(EOS):
 
     def rho(self, p):
 
-        if np.ndim(p) == 0:     # Execute this logic if p is a scalar
+        if isinstance(p, float) or np.ndim(p) == 0:     # Execute this logic if p is a scalar
 
             if self.is_hadron_eos or (self.is_hybrid_eos and (p < self.p_trans)):
                 return self.hadron_eos.rho(p)           # Use the Hadron EOS if p < p_trans
@@ -692,7 +783,7 @@ class HybridEOS(EOS):
 
     def p(self, rho):
 
-        if np.ndim(rho) == 0:       # Execute this logic if rho is a scalar
+        if isinstance(rho, float) or np.ndim(rho) == 0:       # Execute this logic if rho is a scalar
 
             if self.is_hadron_eos or (self.is_hybrid_eos and (rho < self.rho_trans_min)):
                 return self.hadron_eos.p(rho)           # Use the Hadron EOS if rho < rho_trans_min
@@ -729,7 +820,7 @@ class HybridEOS(EOS):
 
     def drho_dp(self, p):
 
-        if np.ndim(p) == 0:     # Execute this logic if p is a scalar
+        if isinstance(p, float) or np.ndim(p) == 0:     # Execute this logic if p is a scalar
 
             if self.is_hadron_eos or (self.is_hybrid_eos and (p < self.p_trans)):
                 return self.hadron_eos.drho_dp(p)       # Use the Hadron EOS if p < p_trans
@@ -763,7 +854,7 @@ class HybridEOS(EOS):
 
     def dp_drho(self, rho):
 
-        if np.ndim(rho) == 0:       # Execute this logic if rho is a scalar
+        if isinstance(rho, float) or np.ndim(rho) == 0:       # Execute this logic if rho is a scalar
 
             if self.is_hadron_eos or (self.is_hybrid_eos and (rho < self.rho_trans_min)):
                 return self.hadron_eos.dp_drho(rho)     # Use the Hadron EOS if rho < rho_trans_min
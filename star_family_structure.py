@@ -20,6 +20,13 @@ class StarFamily:
     MAX_RHO = 1.0e16 * uconv.MASS_DENSITY_CGS_TO_GU     # Maximum density [m^-2]
     WIDE_LOGSPACE = np.logspace(-3.0, 0.0, 15)          # Wide logspace used in values search
     NARROW_LOGSPACE = np.logspace(-0.2, 0.2, 15)        # Narrow logspace used in values search
+    TOV_SOLUTION_ARRAYS = (                             # Names of the arrays that store the TOV solution of the star family
+        "radius_array",                                 # Array with the radii of the stars [m]
+        "mass_array",                                   # Array with the masses of the stars [m]
+        "phase_trans_radius_array",                     # Array with the radii at the phase transitions of the stars [m]
+        "phase_trans_mass_array",                       # Array with the masses at the phase transitions of the stars [m]
+    )
+    SOLUTION_ARRAYS = TOV_SOLUTION_ARRAYS               # Names of all the arrays that store the solution of the star family
 
     def __init__(self, eos, p_center_space, p_surface=dval.P_SURFACE, r_init=dval.R_INIT, r_final=dval.R_FINAL,
                  method=dval.IVP_METHOD, max_step=dval.MAX_STEP, atol_tov=dval.ATOL_TOV, rtol=dval.RTOL):
@@ -57,11 +64,10 @@ class StarFamily:
         # Calculate the rho_center_space
         self.rho_center_space = self.eos.rho(self.p_center_space)
 
+        # Initialize the solution arrays, named by SOLUTION_ARRAYS
+        self._init_solution()
+
         # Initialize star family properties
-        self.radius_array = np.zeros(self.p_center_space.size)                  # Array with the radii of the stars [m]
-        self.mass_array = np.zeros(self.p_center_space.size)                    # Array with the masses of the stars [m]
-        self.phase_trans_radius_array = np.zeros(self.p_center_space.size)      # Array with the radii at the phase transitions of the stars [m]
-        self.phase_trans_mass_array = np.zeros(self.p_center_space.size)        # Array with the masses at the phase transitions of the stars [m]
         self.maximum_mass = np.inf                                              # Maximum mass of the star family [m]
         self.maximum_stable_rho_center = self.MAX_RHO                           # Maximum stable central density of the star family [m^-2]
         self.maximum_stable_p_center = self.eos.p(self.MAX_RHO)                 # Maximum stable central pressure of the star family [m^-2]
@@ -69,6 +75,90 @@ class StarFamily:
         self.canonical_rho_center = self.MAX_RHO                                # Central density of the canonical star (M = 1.4 M_sun) [m^-2]
         self.canonical_p_center = self.eos.p(self.MAX_RHO)                      # Central pressure of the canonical star (M = 1.4 M_sun) [m^-2]
 
+        # Initialize the cache with the solutions of each p_center space already solved, used to avoid repeated solves.
+        # The cache entries are also keyed by the solver settings of the star object, so changing them forces a new solve
+        self.solutions_cache = {}
+
+    def _solution_cache_key(self):
+        """Method that creates the key of the solutions cache, given by the current p_center space and the solver settings of the star object
+
+        Returns:
+            tuple: Key of the solutions cache entry of the current p_center space
+        """
+
+        star_object = self.star_object
+        return (
+            self.p_center_space.tobytes(),
+            star_object.p_surface,
+            star_object.r_init,
+            star_object.r_final,
+            star_object.method,
+            star_object.max_step,
+            np.asarray(star_object.atol_tov, dtype=float).tobytes(),
+            star_object.rtol,
+        )
+
+    def _init_solution(self, array_names=None):
+        """Method that initializes the solution arrays with the size of the current p_center space.
+        The arrays are rows of a single contiguous block, allocated once per solve
+
+        Args:
+            array_names (tuple of str, optional): Names of the solution arrays to be initialized. Defaults to None, using SOLUTION_ARRAYS
+        """
+
+        # Use all the solution arrays of the class by default
+        if array_names is None:
+            array_names = self.SOLUTION_ARRAYS
+
+        # Allocate the block and set each solution array as one of its rows
+        solution_block = np.zeros((len(array_names), self.p_center_space.size))
+        for (array_name, solution_array) in zip(array_names, solution_block):
+            setattr(self, array_name, solution_array)
+
+    def _save_solution(self, array_names=None):
+        """Method that saves the solution of the current p_center space in the solutions cache
+
+        Args:
+            array_names (tuple of str, optional): Names of the solution arrays to be saved. Defaults to None, using SOLUTION_ARRAYS
+        """
+
+        # Use all the solution arrays of the class by default
+        if array_names is None:
+            array_names = self.SOLUTION_ARRAYS
+
+        # Add the solution arrays to the cache entry of the current p_center space
+        cache_entry = self.solutions_cache.setdefault(self._solution_cache_key(), {})
+        for array_name in array_names:
+            cache_entry[array_name] = getattr(self, array_name)
+
+    def _load_solution(self, array_names=None):
+        """Method that loads the solution of the current p_center space from the solutions cache, if available.
+        The solution arrays missing in the cache entry are reinitialized, avoiding arrays left from another p_center space
+
+        Args:
+            array_names (tuple of str, optional): Names of the solution arrays that must be in the cache. Defaults to None, using SOLUTION_ARRAYS
+
+        Returns:
+            bool: Flag that indicates if the solution was loaded
+        """
+
+        # Use all the solution arrays of the class by default
+        if array_names is None:
+            array_names = self.SOLUTION_ARRAYS
+
+        # Check if all the solution arrays of the current p_center space are in the cache
+        cache_entry = self.solutions_cache.get(self._solution_cache_key(), {})
+        if not all(array_name in cache_entry for array_name in array_names):
+            return False
+
+        # Reinitialize the solution arrays and load the ones available in the cache
+        self._init_solution()
+        for array_name in self.SOLUTION_ARRAYS:
+            if array_name in cache_entry:
+                setattr(self, array_name, cache_entry[array_name])
+
+        return True
+
     def _config_plot(self):
         """Method that configures the plotting
         """
@@ -133,8 +223,8 @@ class StarFamily:
             solve_first (bool, optional): Flag that enables the solve in the beginning of the logic. Defaults to False
         """
 
-        # Solve first if requested
-        if solve_first is True:
+        # Solve first if requested, reusing the solution of the same p_center space if it was already calculated
+        if (solve_first is True) and (self._load_solution(self.TOV_SOLUTION_ARRAYS) is False):
             self.solve_tov(False)
 
         # Calculate only the maximum mass using the array directly. Maximum stable properties are only calculated with the stability condition
@@ -162,8 +252,8 @@ class StarFamily:
             plt.legend()
             plt.show()
 
-        # Return the calculated rho_center
-        return self.maximum_stable_rho_center
+        # Return the calculated p_center
+        return self.maximum_stable_p_center
 
     def _calc_canonical_star(self, solve_first=False):
         """Method that calculates the canonical star properties
@@ -172,8 +262,8 @@ class StarFamily:
             solve_first (bool, optional): Flag that enables the solve in the beginning of the logic. Defaults to False
         """
 
-        # Solve first if requested
-        if solve_first is True:
+        # Solve first if requested, reusing the solution of the same p_center space if it was already calculated
+        if (solve_first is True) and (self._load_solution(self.TOV_SOLUTION_ARRAYS) is False):
             self.solve_tov(False)
 
         # Create the (mass - canonical_mass) vs p_center interpolated function
@@ -198,15 +288,15 @@ class StarFamily:
             plt.legend()
             plt.show()
 
-        # Return the calculated rho_center
-        return self.canonical_rho_center
+        # Return the calculated p_center
+        return self.canonical_p_center
 
-    def _find_star(self, finder_method, initial_rho_center=MAX_RHO):
+    def _find_star(self, finder_method, initial_p_center):
         """Method that finds a specific star in the family using the finder method
 
         Args:
-            finder_method (method): Method used to find the star
-            initial_rho_center (float, optional): Initial central density used by the finder. Defaults to MAX_RHO
+            finder_method (method): Method used to find the star, returning the central pressure of the star found
+            initial_p_center (float): Initial central pressure used by the finder [m^-2]
 
         Raises:
             ValueError: Exception in case the initial radial coordinate is too large
@@ -215,21 +305,22 @@ class StarFamily:
         """
 
         # Set the p_center space and rho_center space used to find the star
-        p_center = self.eos.p(initial_rho_center)           # Central pressure [m^-2]
-        self.p_center_space = p_center * self.WIDE_LOGSPACE
+        self.p_center_space = initial_p_center * self.WIDE_LOGSPACE
         self.rho_center_space = self.eos.rho(self.p_center_space)
 
-        # Find the star through finder_method
-        calculated_rho_center = finder_method(True)
+        # Find the star through finder_method. The central pressure found is used directly, avoiding its recalculation from rho_center
+        calculated_p_center = finder_method(True)
 
         # Redefine the p_center space to a stricter interval
-        p_center = self.eos.p(calculated_rho_center)        # Central pressure [m^-2]
-        self.p_center_space = p_center * self.NARROW_LOGSPACE
+        self.p_center_space = calculated_p_center * self.NARROW_LOGSPACE
         self.rho_center_space = self.eos.rho(self.p_center_space)
 
         # Find the star through finder_method
         finder_method(True)
 
+        # Remove the solution of the narrow p_center space from the cache, as only the wide p_center spaces are shared between the finders
+        self.solutions_cache.pop(self._solution_cache_key(), None)
+
     def find_maximum_mass_star(self):
         """Method that finds the maximum mass star
 
@@ -239,7 +330,7 @@ class StarFamily:
             RuntimeError: Exception in case the IVP fails to find the ODE termination event
         """
 
-        self._find_star(self._calc_maximum_mass_star, self.MAX_RHO)
+        self._find_star(self._calc_maximum_mass_star, self.eos.p(self.MAX_RHO))
 
     def find_canonical_star(self):
         """Method that finds the canonical star
@@ -250,7 +341,7 @@ class StarFamily:
             RuntimeError: Exception in case the IVP fails to find the ODE termination event
         """
 
-        self._find_star(self._calc_canonical_star, self.maximum_stable_rho_center)
+        self._find_star(self._calc_canonical_star, self.maximum_stable_p_center)
 
     def solve_tov(self, show_results=True):
         """Method that solves the TOV system, finding the radius and mass of each star in the family
@@ -264,22 +355,23 @@ class StarFamily:
             RuntimeError: Exception in case the IVP fails to find the ODE termination event
         """
 
-        # Reinitialize the radius and mass arrays with the right size
-        self.radius_array = np.zeros(self.p_center_space.size)
-        self.mass_array = np.zeros(self.p_center_space.size)
-        self.phase_trans_radius_array = np.zeros(self.p_center_space.size)
-        self.phase_trans_mass_array = np.zeros(self.p_center_space.size)
+        # Reinitialize the solution arrays with the right size
+        self._init_solution()
 
         # Solve the TOV system for each star in the family
+        star_object = self.star_object
         start_time = perf_counter()
         for k, p_center in enumerate(self.p_center_space):
-            self.star_object.solve_tov(p_center, False)
-            self.radius_array[k] = self.star_object.star_radius
-            self.mass_array[k] = self.star_object.star_mass
-            self.phase_trans_radius_array[k] = self.star_object.star_phase_trans_radius
-            self.phase_trans_mass_array[k] = self.star_object.star_phase_trans_mass
+            star_object.solve_tov(p_center, False)
+            self.radius_array[k] = star_object.star_radius
+            self.mass_array[k] = star_object.star_mass
+            self.phase_trans_radius_array[k] = star_object.star_phase_trans_radius
+            self.phase_trans_mass_array[k] = star_object.star_phase_trans_mass
         self.execution_time = perf_counter() - start_time
 
+        # Save the solution in the cache. Only the TOV solution arrays were calculated
+        self._save_solution(self.TOV_SOLUTION_ARRAYS)
+
         # Configure the plot
         self._config_plot()
 
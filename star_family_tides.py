@@ -18,6 +18,12 @@ class DeformedStarFamily(StarFamily):
         Each star in the family is characterized by a specific value of central pressure (p_center)
     """
 
+    # Class constants
+    SOLUTION_ARRAYS = StarFamily.TOV_SOLUTION_ARRAYS + (    # Names of the arrays that store the solution of the deformed star family
+        "k2_array",                                     # Array with the tidal Love numbers of the stars [dimensionless]
+        "lambda_array",                                 # Array with the tidal deformabilities of the stars [dimensionless]
+    )
+
     def __init__(self, eos, p_center_space, p_surface=dval.P_SURFACE, r_init=dval.R_INIT, r_final=dval.R_FINAL, method=dval.IVP_METHOD,
                  max_step=dval.MAX_STEP, atol_tov=dval.ATOL_TOV, atol_tidal=dval.ATOL_TIDAL, rtol=dval.RTOL):
         """Initialization method
@@ -44,14 +50,22 @@ class DeformedStarFamily(StarFamily):
         # Create a star object with the first p_center value, using instead the DeformedStar class
         self.star_object = DeformedStar(eos, self.p_center_space[0], p_surface, r_init, r_final, method, max_step, atol_tov, atol_tidal, rtol)
 
-        # Initialize deformed star family properties
-        self.k2_array = np.zeros(self.p_center_space.size)              # Array with the tidal Love numbers of the stars [dimensionless]
-        self.lambda_array = np.zeros(self.p_center_space.size)          # Array with the tidal deformabilities of the stars [dimensionless]
+        # Initialize deformed star family properties. The k2 and lambda arrays are initialized by the parent class with SOLUTION_ARRAYS
         self.canonical_lambda = np.inf                                  # Tidal deformability of the canonical star (M = 1.4 M_sun) [dimensionless]
         self.maximum_k2 = np.inf                                        # Maximum k2 of the star family [dimensionless]
         self.maximum_k2_star_rho_center = self.MAX_RHO                  # Central density of the star with the maximum k2 [m^-2]
         self.maximum_k2_star_p_center = self.eos.p(self.MAX_RHO)        # Central pressure of the star with the maximum k2 [m^-2]
 
+    def _solution_cache_key(self):
+        """Method that creates the key of the solutions cache, adding the tidal solver settings of the star object
+
+        Returns:
+            tuple: Key of the solutions cache entry of the current p_center space
+        """
+
+        # Execute parent class' _solution_cache_key method
+        return super()._solution_cache_key() + (self.star_object.atol_tidal,)
+
     def _config_tidal_plot(self):
         """Method that configures the plotting of the tidal related curves
         """
@@ -87,8 +101,8 @@ class DeformedStarFamily(StarFamily):
             solve_first (bool, optional): Flag that enables the solve in the beginning of the logic. Defaults to False
         """
 
-        # Solve first if requested
-        if solve_first is True:
+        # Solve first if requested, reusing the solution of the same p_center space if it was already calculated
+        if (solve_first is True) and (self._load_solution() is False):
             self.solve_combined_tov_tidal(False)
 
         # Calculate the maximum k2 star p_center, rho_center, and k2 using the array directly
@@ -101,14 +115,15 @@ class DeformedStarFamily(StarFamily):
         k2_p_center_spline = CubicSpline(self.p_center_space, self.k2_array, extrapolate=False)
         dk2_dp_center_spline = k2_p_center_spline.derivative()
 
-        # Calculate the maximum k2 star p_center, rho_center, and k2
+        # Calculate the maximum k2 star p_center, rho_center, and k2, evaluating the spline at all roots at once
         dk2_dp_center_roots = dk2_dp_center_spline.roots()
-        for dk2_dp_center_root in dk2_dp_center_roots:
-            possible_maximum_k2 = k2_p_center_spline(dk2_dp_center_root)
-            if possible_maximum_k2 > self.maximum_k2:
-                self.maximum_k2_star_p_center = dk2_dp_center_root
+        if dk2_dp_center_roots.size > 0:
+            possible_maximum_k2_array = k2_p_center_spline(dk2_dp_center_roots)
+            possible_maximum_k2_index = np.argmax(possible_maximum_k2_array)
+            if possible_maximum_k2_array[possible_maximum_k2_index] > self.maximum_k2:
+                self.maximum_k2_star_p_center = dk2_dp_center_roots[possible_maximum_k2_index]
                 self.maximum_k2_star_rho_center = self.eos.rho(self.maximum_k2_star_p_center)
-                self.maximum_k2 = possible_maximum_k2
+                self.maximum_k2 = possible_maximum_k2_array[possible_maximum_k2_index]
 
         # Debug graph
         if const.DEBUG is True:
@@ -119,8 +134,8 @@ class DeformedStarFamily(StarFamily):
             plt.legend()
             plt.show()
 
-        # Return the calculated rho_center
-        return self.maximum_k2_star_rho_center
+        # Return the calculated p_center
+        return self.maximum_k2_star_p_center
 
     def _calc_canonical_lambda(self):
         """Method that calculates the tidal deformability of the canonical star (M = 1.4 M_sun)
@@ -130,7 +145,7 @@ class DeformedStarFamily(StarFamily):
         if self.canonical_rho_center < self.MAX_RHO:
 
             # Solve the combined TOV+tidal system for the canonical star and get the canonical tidal deformability
-            self.star_object.solve_combined_tov_tidal(self.eos.p(self.canonical_rho_center), False)
+            self.star_object.solve_combined_tov_tidal(self.canonical_p_center, False)
             self.canonical_lambda = self.star_object.lambda_tidal
 
     def find_canonical_star(self):
@@ -150,7 +165,7 @@ class DeformedStarFamily(StarFamily):
             RuntimeError: Exception in case the IVP fails to find the ODE termination event
         """
 
-        self._find_star(self._calc_maximum_k2_star, self.maximum_stable_rho_center)
+        self._find_star(self._calc_maximum_k2_star, self.maximum_stable_p_center)
 
     def solve_combined_tov_tidal(self, show_results=True):
         """Method that solves the combined TOV+tidal system for each star in the family, finding p, m, nu, and y
@@ -164,26 +179,25 @@ class DeformedStarFamily(StarFamily):
             RuntimeError: Exception in case the IVP fails to find the ODE termination event
         """
 
-        # Reinitialize the arrays with the right size
-        self.radius_array = np.zeros(self.p_center_space.size)
-        self.mass_array = np.zeros(self.p_center_space.size)
-        self.phase_trans_radius_array = np.zeros(self.p_center_space.size)
-        self.phase_trans_mass_array = np.zeros(self.p_center_space.size)
-        self.k2_array = np.zeros(self.p_center_space.size)
-        self.lambda_array = np.zeros(self.p_center_space.size)
+        # Reinitialize the solution arrays with the right size
+        self._init_solution()
 
         # Solve the combined TOV+tidal system for each star in the family
+        star_object = self.star_object
         start_time = perf_counter()
         for k, p_center in enumerate(self.p_center_space):
-            self.star_object.solve_combined_tov_tidal(p_center, False)
-            self.radius_array[k] = self.star_object.star_radius
-            self.mass_array[k] = self.star_object.star_mass
-            self.phase_trans_radius_array[k] = self.star_object.star_phase_trans_radius
-            self.phase_trans_mass_array[k] = self.star_object.star_phase_trans_mass
-            self.k2_array[k] = self.star_object.k2
-            self.lambda_array[k] = self.star_object.lambda_tidal
+            star_object.solve_combined_tov_tidal(p_center, False)
+            self.radius_array[k] = star_object.star_radius
+            self.mass_array[k] = star_object.star_mass
+            self.phase_trans_radius_array[k] = star_object.star_phase_trans_radius
+            self.phase_trans_mass_array[k] = star_object.star_phase_trans_mass
+            self.k2_array[k] = star_object.k2
+            self.lambda_array[k] = star_object.lambda_tidal
         self.execution_time = perf_counter() - start_time
 
+        # Save the solution in the cache
+        self._save_solution()
+
         # Configure the plot
         self._config_plot()
         self._config_tidal_plot()
@@ -13,6 +13,7 @@ class Star:
 
     # Class constants
     FIGURES_PATH = "figures/star"       # Path of the figures folder
+    FOUR_PI = 4 * np.pi                 # Factor 4 pi of the ODE systems and of the y boundary corrections
 
     def __init__(self, eos, p_center, p_surface=dval.P_SURFACE, r_init=dval.R_INIT, r_final=dval.R_FINAL,
                  method=dval.IVP_METHOD, max_step=dval.MAX_STEP, atol_tov=dval.ATOL_TOV, rtol=dval.RTOL):
@@ -55,12 +56,34 @@ class Star:
         self.star_phase_trans_radius = 0.0      # Star radius at the phase transition (R_trans) [m]
         self.star_phase_trans_mass = 0.0        # Star mass at the phase transition (M_trans) [m]
 
-        # Initialize the star structure arrays of the ODE solution. Necessary to append the solutions
-        self.r_ode_solution = np.array([])
-        self.p_ode_solution = np.array([])
-        self.m_ode_solution = np.array([])
-        self.nu_ode_solution = np.array([])
-        self.rho_ode_solution = np.array([])
+        # Initialize the arrays of the ODE solution with the _reset_ode_solution method of the class. Necessary to append the solutions
+        self._reset_ode_solution()
+
+    def _tov_ode_terms(self, r, p, m):
+        """Method that calculates the TOV ODE system derivatives inside the star, together with the terms shared with the other ODE systems
+
+        Args:
+            r (float): Radial coordinate r [m]
+            p (float): Pressure at r [m^-2]
+            m (float): Mass at r [m]
+
+        Returns:
+            tuple of float: Derivatives (dp_dr, dm_dr, dnu_dr) followed by the shared terms (rho, rho_plus_p, r2, r_minus_2m)
+        """
+
+        # Common terms of the ODE systems, computed only once
+        rho = self.eos.rho(p)
+        rho_plus_p = rho + p
+        r2 = r * r
+        r_minus_2m = r - 2 * m
+        four_pi_r2 = self.FOUR_PI * r2
+
+        # ODE System that describes the interior structure of the star
+        dnu_dr = (2 * (m + four_pi_r2 * r * p)) / (r * r_minus_2m)          # Rate of change of the metric function
+        dp_dr = -(rho_plus_p / 2) * dnu_dr                                  # Rate of change of the pressure
+        dm_dr = four_pi_r2 * rho                                            # Rate of change of the mass
+
+        return (dp_dr, dm_dr, dnu_dr, rho, rho_plus_p, r2, r_minus_2m)
 
     def _tov_ode_system(self, r, s):
         """Method that implements the TOV ODE system in the form ``ds/dr = f(r, s)``, used by the IVP solver
@@ -73,22 +96,15 @@ class Star:
             array of float: Right hand side of the equation ``ds/dr = f(r, s)`` (dp_dr, dm_dr, dnu_dr)
         """
 
-        # Variables of the system
-        (p, m, nu) = s
+        # Variables of the system, converted to Python floats as they are faster than numpy scalars in scalar arithmetic
+        r = float(r)
+        (p, m, nu) = s.tolist()
 
         # Set derivatives to zero to saturate functions, as this condition indicates the end of integration
         if p <= self.p_surface:
-            dp_dr = 0.0
-            dm_dr = 0.0
-            dnu_dr = 0.0
-        else:
-            # ODE System that describes the interior structure of the star
-            rho = self.eos.rho(p)
-            dnu_dr = (2 * (m + 4 * np.pi * r**3 * p)) / (r * (r - 2 * m))       # Rate of change of the metric function
-            dp_dr = -((rho + p) / 2) * dnu_dr                                   # Rate of change of the pressure
-            dm_dr = 4 * np.pi * r**2 * rho                                      # Rate of change of the mass
-
-        return (dp_dr, dm_dr, dnu_dr)
+            return (0.0, 0.0, 0.0)
+
+        return self._tov_ode_terms(r, p, m)[:3]
 
     def _tov_ode_phase_transition_event(self, r, s):
         """Event method used by the IVP solver to find the phase transition, if present.
@@ -120,6 +136,16 @@ class Star:
 
     _tov_ode_termination_event.terminal = True              # Set the event as a terminal event, terminating the integration of the ODE
 
+    def _reset_ode_solution(self):
+        """Method that resets the star structure arrays of the ODE solution, as the star object is reused for every star in a family
+        """
+
+        self.r_ode_solution = np.array([])
+        self.p_ode_solution = np.array([])
+        self.m_ode_solution = np.array([])
+        self.nu_ode_solution = np.array([])
+        self.rho_ode_solution = np.array([])
+
     def _calc_tov_init_values(self, p_center=None):
         """Method that calculates the initial values used by the TOV solver
 
@@ -210,7 +236,8 @@ class Star:
             RuntimeError: Exception in case the IVP fails to find the ODE termination event
         """
 
-        # Calculate the TOV ODE system initial values
+        # Reset the ODE solution arrays and calculate the TOV ODE system initial values
+        self._reset_ode_solution()
         self._calc_tov_init_values(p_center)
 
         # Configure the solver events
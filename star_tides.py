@@ -46,7 +46,13 @@ class DeformedStar(Star):
         self.k2 = 0.0               # Tidal Love number [dimensionless]
         self.lambda_tidal = 0.0     # Tidal deformability [dimensionless]
 
-        # Initialize the perturbation array of the ODE solution. Necessary to append the solutions
+    def _reset_ode_solution(self):
+        """Method that resets the star structure and perturbation arrays of the ODE solution, as the star object is reused for every star in a family
+        """
+
+        # Execute parent class' _reset_ode_solution method
+        super()._reset_ode_solution()
+
         self.y_ode_solution = np.array([])
 
     def _combined_tov_tidal_ode_system(self, r, s):
@@ -60,33 +66,34 @@ class DeformedStar(Star):
             array of float: Right hand side of the equation ``ds/dr = f(r, s)`` (dp_dr, dm_dr, dnu_dr, dy_dr)
         """
 
-        # Variables of the system
-        (p, m, nu, y) = s
+        # Variables of the system, converted to Python floats as in _tov_ode_system
+        r = float(r)
+        (p, m, nu, y) = s.tolist()
 
-        # Call the TOV ODE system
-        (dp_dr, dm_dr, dnu_dr) = self._tov_ode_system(r, (p, m, nu))
-
-        # Set the derivative to zero to saturate the function, as this condition indicates the end of integration
+        # Set derivatives to zero to saturate functions, as this condition indicates the end of integration
         if p <= self.p_surface:
-            dy_dr = 0.0
-        else:
-            # Functions and derivatives evaluated at current r
-            rho = self.eos.rho(p)
-            drho_dp = self.eos.drho_dp(p)
-            exp_lambda = (1 - 2 * m / r)**(-1)
-
-            # Coefficients of the tidal ODE
-            c0 = (
-                exp_lambda * (
-                    - (6 / r**2)
-                    + 4 * np.pi * ((rho + p) * drho_dp + 5 * rho + 9 * p)
-                )
-                - (dnu_dr)**2
+            return (0.0, 0.0, 0.0, 0.0)
+
+        # TOV ODE system and the common terms shared with the tidal ODE
+        (dp_dr, dm_dr, dnu_dr, rho, rho_plus_p, r2, r_minus_2m) = self._tov_ode_terms(r, p, m)
+
+        # Functions and derivatives evaluated at current r
+        drho_dp = self.eos.drho_dp(p)
+        four_pi = self.FOUR_PI
+        exp_lambda = r / r_minus_2m
+
+        # Coefficients of the tidal ODE
+        c0 = (
+            exp_lambda * (
+                - (6 / r2)
+                + four_pi * (rho_plus_p * drho_dp + 5 * rho + 9 * p)
             )
-            c1 = (2 / r) + exp_lambda * ((2 * m / r**2) + 4 * np.pi * r * (p - rho))
+            - dnu_dr * dnu_dr
+        )
+        c1 = (2 / r) + exp_lambda * ((2 * m / r2) + four_pi * r * (p - rho))
 
-            # ODE system that describes the tidal deformation of the star
-            dy_dr = ((1 / r) - c1) * y - (y**2 / r) - c0 * r
+        # ODE system that describes the tidal deformation of the star
+        dy_dr = ((1 / r) - c1) * y - (y * y / r) - c0 * r
 
         # Return f(r, s) of the combined system
         return (dp_dr, dm_dr, dnu_dr, dy_dr)
@@ -111,7 +118,7 @@ class DeformedStar(Star):
 
         # Calculate the compactness C and perturbation at the surface y_s
         c = self.star_mass / self.star_radius
-        delta_y_s = - 4 * np.pi * self.star_radius**3 * self.rho_ode_solution[-1] / self.star_mass
+        delta_y_s = - self.FOUR_PI * self.star_radius**3 * self.rho_ode_solution[-1] / self.star_mass
         y_s = self.y_ode_solution[-1] + delta_y_s
 
         # Calculate the tidal Love number k2 and the tidal deformability Lambda
@@ -144,7 +151,7 @@ class DeformedStar(Star):
 
         # Calculate the Delta_y correction
         delta_rho = self.eos.rho_trans_min - self.eos.rho_trans_max     # delta_rho = rho(r_d + e) - rho(r_d - e)
-        denominator = (self.star_phase_trans_mass / (4 * np.pi * self.star_phase_trans_radius**3)) + self.eos.p_trans
+        denominator = (self.star_phase_trans_mass / (self.FOUR_PI * self.star_phase_trans_radius**3)) + self.eos.p_trans
         delta_y = delta_rho / denominator
 
         # Reconfigure the init values to continue the integration after the phase transition
@@ -182,7 +189,8 @@ class DeformedStar(Star):
             RuntimeError: Exception in case the IVP fails to find the ODE termination event
         """
 
-        # Calculate the TOV ODE system initial values
+        # Reset the ODE solution arrays and calculate the TOV ODE system initial values
+        self._reset_ode_solution()
         self._calc_tov_init_values(p_center)
 
         # Configure the solver events